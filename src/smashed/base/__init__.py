@@ -1,4 +1,5 @@
 from .abstract import AbstractBaseMapper
+from .columnar import ColumnarDataset
 from .mappers import BatchedBaseMapper, SingleBaseMapper
 from .pipeline import make_pipeline
 from .recipes import BaseRecipe
@@ -15,6 +16,7 @@ __all__ = [
     "BaseMapper",
     "BaseRecipe",
     "BatchedBaseMapper",
+    "ColumnarDataset",
     "DataBatchView",
     "DataRowView",
     "make_pipeline",
@@ -1,4 +1,14 @@
-from typing import Any, Generic, Iterable, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .types import TransformElementType
 
@@ -9,6 +19,10 @@ S = TypeVar("S")
 class AbstractBaseMapper(Generic[D, S]):
     """An abstract implementation of a Mapper"""
 
+    # mappers that do not need a __dict__ can declare __slots__;
+    # for that to work, all base classes must declare them too.
+    __slots__ = ()
+
     input_fields: Tuple[str, ...]
     output_fields: Tuple[str, ...]
     fingerprint: str
@@ -52,11 +66,31 @@ class AbstractBaseMapper(Generic[D, S]):
             f"Subclasses {self.__class__.__name__} must implement transform"
         )
 
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """Apply the transformation for this mapper to a dataset stored
+        column-wise, i.e. as a dictionary of field names to lists of
+        values, one per sample.
+
+        Args:
+            columns (Dict[str, List[Any]]): The columns to transform.
+
+        Returns:
+            Dict[str, List[Any]]: The transformed columns.
+        """
+        raise NotImplementedError(
+            f"Subclasses {self.__class__.__name__} must implement "
+            "transform_columns"
+        )
+
 
 class AbstractSingleBaseMapper(AbstractBaseMapper):
     """An abstract implementation of a Mapper that operates on a single
     element."""
 
+    __slots__ = ()
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         """Transform a single sample of a dataset. This method should be
         overridden by actual mapper implementations.
@@ -75,11 +109,31 @@ class AbstractSingleBaseMapper(AbstractBaseMapper):
             f"Subclasses {self.__class__.__name__} must implement transform"
         )
 
+    def transform_samples(
+        self, samples: Sequence[TransformElementType]
+    ) -> List[TransformElementType]:
+        """Transform a sequence of samples of a dataset, returning one
+        transformed sample for each input sample.
+
+        Args:
+            samples (Sequence[TransformElementType]): The samples to
+                transform.
+
+        Returns:
+            List[TransformElementType]: The transformed samples.
+        """
+        raise NotImplementedError(
+            f"Subclasses {self.__class__.__name__} must implement "
+            "transform_samples"
+        )
+
 
 class AbstractBatchedBaseMapper(AbstractBaseMapper):
     """An abstract implementation of a Mapper that operates on a batch of
     elements."""
 
+    __slots__ = ()
+
     def transform(
         self, data: Iterable[TransformElementType]
     ) -> Iterable[TransformElementType]:
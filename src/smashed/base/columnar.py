@@ -0,0 +1,88 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    Optional,
+)
+
+
+class ColumnarDataset:
+    """A dataset stored column-wise (struct of arrays): one list per field
+    instead of one dictionary per sample. Mappers that implement
+    `transform_columns` operate on whole columns at once; all other mappers
+    are applied sample by sample."""
+
+    __slots__ = ("columns", "n")
+
+    columns: Dict[str, List[Any]]
+    n: int
+
+    def __init__(self, columns: Dict[str, List[Any]], n: Optional[int] = None):
+        """
+        Args:
+            columns (Dict[str, List[Any]]): A mapping from field names to
+                the list of values of that field for every sample.
+            n (int, optional): Number of samples in the dataset. If not
+                provided, it is inferred from the length of the columns.
+                Required if no columns are provided.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                "All columns must have the same length; got lengths "
+                f"{sorted(lengths)}"
+            )
+
+        if n is None:
+            n = lengths.pop() if lengths else 0
+        elif lengths and n not in lengths:
+            raise ValueError(f"Expected columns of length {n}")
+
+        self.columns = columns
+        self.n = n
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "ColumnarDataset":
+        """Create a columnar dataset from an iterable of samples."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        if len(rows) == 0:
+            return cls(columns={})
+
+        return cls(
+            columns={k: [row[k] for row in rows] for k in rows[0].keys()},
+            n=len(rows),
+        )
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Return the dataset as a list of dictionaries, one per sample."""
+        return list(self)
+
+    def keys(self) -> KeysView[str]:
+        return self.columns.keys()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, idx: int) -> Dict[str, Any]:
+        if idx < -self.n or idx >= self.n:
+            raise IndexError("ColumnarDataset index out of range")
+        return {k: v[idx] for k, v in self.columns.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.columns:
+            return ({} for _ in range(self.n))
+
+        keys = tuple(self.columns.keys())
+        return (dict(zip(keys, row)) for row in zip(*self.columns.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarDataset):
+            return False
+        return self.n == other.n and self.columns == other.columns
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={self.n}, columns={self.columns})"
@@ -1,5 +1,8 @@
 import logging
+import math
+import pickle
 from collections import abc
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -22,6 +25,7 @@ from .abstract import (
     AbstractBatchedBaseMapper,
     AbstractSingleBaseMapper,
 )
+from .columnar import ColumnarDataset
 from .types import TransformBatchType, TransformElementType
 from .views import DataBatchView
 
@@ -46,11 +50,34 @@ with necessary("datasets", soft=True) as HUGGINGFACE_DATASET_AVAILABLE:
 Logger = logging.getLogger(__name__)
 
 
+# mapper used by the worker processes of a parallel map; it is set once
+# per worker so that it does not have to be pickled for every chunk.
+_WORKER_MAPPER: Union["MapMethodInterfaceMixIn", None] = None
+
+# below this many samples, starting the worker processes costs more than
+# mapping the whole dataset in the current one.
+_MIN_PARALLEL_MAP_SIZE = 1024
+
+
+def _init_parallel_map_worker(mapper: "MapMethodInterfaceMixIn") -> None:
+    global _WORKER_MAPPER
+    _WORKER_MAPPER = mapper
+
+
+def _map_chunk_in_worker(
+    chunk: List[TransformElementType], map_kwargs: Dict[str, Any]
+) -> List[TransformElementType]:
+    assert _WORKER_MAPPER is not None, "worker has not been initialized"
+    return _WORKER_MAPPER.map(chunk, **map_kwargs)
+
+
 class MapMethodInterfaceMixIn(AbstractBaseMapper):
     """Mix-in class that implements the map method for all mappers
     and various interfaces. Do not inherit from this class directly,
     but use SingleBaseMapper/BatchedBaseMapper instead."""
 
+    __slots__ = ()
+
     @classmethod
     def always_remove_columns(cls) -> bool:
         """Whether this mapper should always remove its input columns
@@ -58,6 +85,14 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
         if the output columns are not a subset of the input columns."""
         return False
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        """Whether samples can be transformed by independent copies of this
+        mapper, each working on a different chunk of the dataset. Only
+        stateless mappers should return True; mappers that count samples
+        or write to disk, for example, must be applied in one process."""
+        return False
+
     @property
     def name(self) -> str:
         """The name of this mapper. By default, this is the name of the
@@ -145,6 +180,14 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
 
         return transformed_batch
 
+    def _single_transform_huggingface_datasets(
+        self, data: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """Applies a single mapper to a datasets.Dataset batch; the batch
+        is already stored column-wise, so it goes through transform_columns
+        rather than one call to the mapper per sample."""
+        return self.transform_columns({k: data[k] for k in data.keys()})
+
     def one(self, **sample: TransformElementType) -> TransformElementType:
         """Transform a single sample. A convenience method that is
         equivalent to self.map([sample])[0].
@@ -179,12 +222,83 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
             "interface not implemented."
         )
 
+    def _can_map_in_parallel(self) -> bool:
+        """Whether this mapper and the ones after it can be applied to
+        chunks of a dataset independently. Batched mappers might combine
+        samples across chunk boundaries, mappers that keep state or
+        override map (e.g., caching mappers) must see the whole dataset,
+        and mappers that can't be pickled can't be sent to worker
+        processes."""
+        mapper: Union[AbstractBaseMapper, None] = self
+        while mapper is not None:
+            if not (
+                isinstance(mapper, AbstractSingleBaseMapper)
+                and isinstance(mapper, MapMethodInterfaceMixIn)
+                and mapper.supports_parallel_map()
+                and not self._overrides_map(mapper)
+            ):
+                return False
+            mapper = mapper.pipeline
+
+        try:
+            pickle.dumps(self)
+        except Exception as e:
+            Logger.warning(
+                f"Cannot pickle {self.name} ({e}); mapping in one process."
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _overrides_map(mapper: "MapMethodInterfaceMixIn") -> bool:
+        # map is a trouting descriptor, so we look up which class in the
+        # mro defines it rather than comparing the (re-bound) attributes.
+        for cls in type(mapper).__mro__:
+            if "map" in vars(cls):
+                return cls is not MapMethodInterfaceMixIn
+        return False
+
+    def _map_list_of_dicts_parallel(
+        self,
+        dataset: Sequence[TransformElementType],
+        **map_kwargs: Any,
+    ) -> List[TransformElementType]:
+        num_proc = int(map_kwargs["num_proc"])
+
+        # a few chunks per process, so that a slow chunk does not leave
+        # the other processes idle at the end of the map.
+        chunksize = math.ceil(len(dataset) / (num_proc * 4))
+        chunks = [
+            list(dataset[i : i + chunksize])
+            for i in range(0, len(dataset), chunksize)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=num_proc,
+            initializer=_init_parallel_map_worker,
+            initargs=(self,),
+        ) as executor:
+            # each worker maps its chunks through the whole pipeline
+            worker_kwargs = {**map_kwargs, "num_proc": 1}
+            mapped_chunks = executor.map(
+                _map_chunk_in_worker, chunks, [worker_kwargs] * len(chunks)
+            )
+            return list(chain.from_iterable(mapped_chunks))
+
     @map.add_interface(dataset=list)
     def _map_list_of_dicts(
         self,
         dataset: Sequence[TransformElementType],
         **map_kwargs: Any,
     ) -> Sequence[TransformElementType]:
+        num_proc = int(map_kwargs.get("num_proc", None) or 1)
+        if (
+            num_proc > 1
+            and isinstance(dataset, abc.Sequence)
+            and len(dataset) > _MIN_PARALLEL_MAP_SIZE
+            and self._can_map_in_parallel()
+        ):
+            return self._map_list_of_dicts_parallel(dataset, **map_kwargs)
+
         # explicitly casting to a boolean since this is all that is
         # supported by the simple mapper.
         # TODO[lucas]: maybe support specifying which fields to keep?
@@ -214,17 +328,24 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
             transformed_dataset = list(transformed_dataset_it)
 
         elif isinstance(self, AbstractSingleBaseMapper):
+            if not isinstance(dataset, abc.Sequence):
+                dataset = list(dataset)
+
+            # some mappers are faster when given all samples at once
+            transformed_samples = self.transform_samples(dataset)
+
             if remove_columns:
                 # we don't care about the original columns
-                transformed_dataset = [
-                    self.transform(sample) for sample in dataset
-                ]
+                transformed_dataset = transformed_samples
             else:
                 # user wants to keep the columns, so we merge the new fields
                 # with the old fields, while keeping the new ones if there
                 # is a name conflict
                 transformed_dataset = [
-                    {**sample, **self.transform(sample)} for sample in dataset
+                    {**sample, **transformed}
+                    for sample, transformed in zip(
+                        dataset, transformed_samples
+                    )
                 ]
         else:
             raise TypeError(
@@ -242,6 +363,55 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
         else:
             return transformed_dataset
 
+    @map.add_interface(dataset=ColumnarDataset)
+    def _map_columnar_dataset(
+        self,
+        dataset: ColumnarDataset,
+        **map_kwargs: Any,
+    ) -> ColumnarDataset:
+        # same semantics as the list of dicts interface, but the
+        # dataset is passed to the mapper one column at the time.
+        remove_columns = (
+            bool(map_kwargs.get("remove_columns", False))
+            or self.always_remove_columns()
+        )
+
+        self._check_fields_datasets(
+            provided_fields=dataset.keys(),
+            expected_fields=self.input_fields,
+        )
+
+        columns = self.transform_columns(dataset.columns)
+
+        if isinstance(self, AbstractBatchedBaseMapper):
+            if remove_columns:
+                columns = {
+                    k: v for k, v in columns.items() if k in dataset.columns
+                }
+            transformed_dataset = ColumnarDataset(columns)
+
+        elif isinstance(self, AbstractSingleBaseMapper):
+            if not remove_columns:
+                # new fields take precedence over the old ones in case
+                # of a name conflict.
+                columns = {**dataset.columns, **columns}
+            transformed_dataset = ColumnarDataset(columns, n=dataset.n)
+        else:
+            raise TypeError(
+                "Mapper must inherit a SingleBaseMapper or a BatchedBaseMapper"
+            )
+
+        if len(transformed_dataset) > 0:
+            self._check_fields_datasets(
+                provided_fields=transformed_dataset.keys(),
+                expected_fields=self.output_fields,
+            )
+
+        if self.pipeline:
+            return self.pipeline.map(transformed_dataset, **map_kwargs)
+        else:
+            return transformed_dataset
+
     if HUGGINGFACE_DATASET_AVAILABLE:
 
         @map.add_interface(dataset=(Dataset, IterableDataset))
@@ -276,9 +446,10 @@ class MapMethodInterfaceMixIn(AbstractBaseMapper):
                 )
             elif isinstance(self, AbstractSingleBaseMapper):
                 transformed_dataset = dataset.map(
-                    self.transform,
+                    self._single_transform_huggingface_datasets,
                     **{
                         **map_kwargs,
+                        "batched": True,
                         "remove_columns": remove_columns,
                         # add name of mapper as description if a description
                         # has not been provided
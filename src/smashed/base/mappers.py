@@ -3,7 +3,18 @@ import hashlib
 import inspect
 import pickle
 from itertools import chain
-from typing import Iterable, NamedTuple, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from ..utils import bytes_from_int, int_from_bytes
 from .abstract import (
@@ -11,6 +22,7 @@ from .abstract import (
     AbstractBatchedBaseMapper,
     AbstractSingleBaseMapper,
 )
+from .columnar import ColumnarDataset
 from .interfaces import MapMethodInterfaceMixIn
 from .types import TransformElementType
 
@@ -18,6 +30,8 @@ P = TypeVar("P", bound="ChainableMapperMixIn")
 
 
 class ChainableMapperMixIn(AbstractBaseMapper):
+    __slots__ = ("input_fields", "output_fields", "fingerprint", "pipeline")
+
     input_fields: Tuple[str, ...]
     output_fields: Tuple[str, ...]
     fingerprint: str
@@ -113,15 +127,27 @@ class ChainableMapperMixIn(AbstractBaseMapper):
 
         return result
 
+    def _get_slots_values(self) -> Dict[str, Any]:
+        """Return the values of all slots defined in the MRO of this
+        mapper, except for the pipeline. Slots that have not been set
+        are skipped."""
+        return {
+            slot: getattr(self, slot)
+            for slot in chain.from_iterable(
+                getattr(s, "__slots__", ()) for s in type(self).__mro__
+            )
+            if slot != "pipeline" and hasattr(self, slot)
+        }
+
     def __getstate__(self) -> dict:
         """Return the state of this mapper for pickling."""
         state = {
             "__dict__": {
-                k: v for k, v in self.__dict__.items() if k != "pipeline"
-            },
-            "__slots__": {
-                k: getattr(self, k) for k in getattr(self, "__slots__", [])
+                k: v
+                for k, v in getattr(self, "__dict__", {}).items()
+                if k != "pipeline"
             },
+            "__slots__": self._get_slots_values(),
             # pipeline gets its own special treatment, which
             # is really just recursive pickling
             "pipeline": pickle.dumps(self.pipeline),
@@ -131,7 +157,8 @@ class ChainableMapperMixIn(AbstractBaseMapper):
 
     def __setstate__(self, state: dict) -> None:
         """Set the state of this mapper after unpickling."""
-        self.__dict__.update(state.get("__dict__", {}))
+        if state.get("__dict__", None):
+            self.__dict__.update(state["__dict__"])
         for k, v in state.get("__slots__", {}).items():
             setattr(self, k, v)
         self.pipeline = pickle.loads(state["pipeline"])
@@ -146,19 +173,17 @@ class ChainableMapperMixIn(AbstractBaseMapper):
         # this dict helps with memoization in case of circular references
         memo[id(self)] = result
 
-        for key in self.__dict__:
-            if key == "pipeline":
-                # don't copy the pipeline
-                setattr(result, key, None)
-            else:
-                # copy the rest of the attributes
-                setattr(result, key, copy.deepcopy(self.__dict__[key], memo))
-
-        for slot in chain.from_iterable(
-            getattr(s, "__slots__", []) for s in self.__class__.__mro__
-        ):
+        for key, value in getattr(self, "__dict__", {}).items():
+            if key != "pipeline":
+                # copy the attributes, except for the pipeline
+                setattr(result, key, copy.deepcopy(value, memo))
+
+        for slot, value in self._get_slots_values().items():
             # copy the slots
-            setattr(result, slot, copy.deepcopy(getattr(self, slot), memo))
+            setattr(result, slot, copy.deepcopy(value, memo))
+
+        # don't copy the pipeline
+        result.pipeline = None
 
         return result
 
@@ -174,7 +199,13 @@ class ChainableMapperMixIn(AbstractBaseMapper):
         if not isinstance(other, type(self)):
             return False
 
-        return hash(self) == hash(other)
+        # fingerprints are computed once when the mapper is created, so
+        # comparing them stage by stage is cheaper than hashing both
+        # pipelines in full.
+        return (
+            self.fingerprint == other.fingerprint
+            and self.pipeline == other.pipeline
+        )
 
     def _get_mapper_fingerprint(self) -> str:
         """Compute a hash for this mapper; the hash depends of the arguments
@@ -252,6 +283,8 @@ class SingleBaseMapper(
     and return a single sample dictionary as output.
     """
 
+    __slots__ = ()
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         """Transform a single sample of a dataset. This method should be
         overridden by actual mapper implementations.
@@ -270,6 +303,44 @@ class SingleBaseMapper(
             f"Subclasses {self.__class__.__name__} must implement transform"
         )
 
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """Transform a dataset stored column-wise. Mappers that can operate
+        on whole columns at once (e.g., using numpy) should override this
+        method; by default, it calls transform on each sample.
+
+        Args:
+            columns (Dict[str, List[Any]]): The columns to transform; each
+                column has one value per sample.
+
+        Returns:
+            Dict[str, List[Any]]: The transformed columns. Each column
+                must have one value per input sample.
+        """
+        dataset = ColumnarDataset(columns)
+        return ColumnarDataset.from_rows(
+            self.transform(sample) for sample in dataset
+        ).columns
+
+    def transform_samples(
+        self, samples: Sequence[TransformElementType]
+    ) -> List[TransformElementType]:
+        """Transform a sequence of samples, such as a list of dictionaries.
+        Mappers that are faster when processing many samples at once
+        (e.g., tokenizers) should override this method; by default, it
+        calls transform on each sample.
+
+        Args:
+            samples (Sequence[TransformElementType]): The samples to
+                transform.
+
+        Returns:
+            List[TransformElementType]: The transformed samples, one for
+                each input sample.
+        """
+        return [self.transform(sample) for sample in samples]
+
 
 class BatchedBaseMapper(
     MapMethodInterfaceMixIn,
@@ -286,6 +357,8 @@ class BatchedBaseMapper(
     returned may be different from the number of samples in the input.
     """
 
+    __slots__ = ()
+
     def transform(
         self, data: Iterable[TransformElementType]
     ) -> Iterable[TransformElementType]:
@@ -307,3 +380,21 @@ class BatchedBaseMapper(
         raise NotImplementedError(
             f"Subclasses {self.__class__.__name__} must implement transform"
         )
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """Transform a dataset stored column-wise. By default, this method
+        calls transform on the samples of the dataset.
+
+        Args:
+            columns (Dict[str, List[Any]]): The columns to transform; each
+                column has one value per sample.
+
+        Returns:
+            Dict[str, List[Any]]: The transformed columns. The number of
+                values in each column may be different from the number of
+                samples in the input.
+        """
+        dataset = ColumnarDataset(columns)
+        return ColumnarDataset.from_rows(self.transform(dataset)).columns
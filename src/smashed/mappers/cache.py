@@ -171,7 +171,7 @@ class EndCachingMapper(SingleBaseMapper):
     received by this mapper will be cached to disk. Must be paired with a
     StartCachingMapper."""
 
-    __slots__ = ("cache_path",)
+    __slots__ = ("cache_path", "logger")
 
     cache_path: Union[Path, None]
 
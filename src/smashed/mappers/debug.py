@@ -57,6 +57,10 @@ class MockMapper(_MockMapperMixIn, SingleBaseMapper):
     """A single mapper that returns the same data it receives.
     Used for testing."""
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         return {k: v + self.value for k, v in data.items()}
 
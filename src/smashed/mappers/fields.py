@@ -18,6 +18,8 @@ class ChangeFieldsMapper(SingleBaseMapper):
     """Mapper that removes some of the fields in a dataset.
     Either `keep_fields` or `drop_fields` must be specified, but not both."""
 
+    __slots__ = ("keep_fields", "drop_fields")
+
     @classmethod
     def always_remove_columns(cls) -> bool:
         return True
@@ -70,6 +72,8 @@ class ChangeFieldsMapper(SingleBaseMapper):
 class RenameFieldsMapper(SingleBaseMapper):
     """Mapper that renames some of the fields batch"""
 
+    __slots__ = ("rename_fields_map", "remove_rest")
+
     @classmethod
     def always_remove_columns(cls) -> bool:
         return True
@@ -103,6 +107,8 @@ class RenameFieldsMapper(SingleBaseMapper):
 class MakeFieldMapper(SingleBaseMapper):
     """Mapper that adds a new field to a dataset."""
 
+    __slots__ = ("value", "shape_like")
+
     def __init__(
         self: "MakeFieldMapper",
         field_name: str,
@@ -1,5 +1,6 @@
-from functools import cached_property
-from typing import TYPE_CHECKING, Dict, Union
+import sys
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 import glom
 from necessary import necessary
@@ -17,6 +18,29 @@ with necessary("datasets", soft=True) as DATASETS_AVAILABLE:
             )
 
 
+PathSegments = Tuple[Tuple[str, Optional[int]], ...]
+
+
+@lru_cache(maxsize=1024)
+def _compile_str_path(path: str) -> Optional[PathSegments]:
+    """Split a dotted path (e.g. "answers.text") into (key, index) segments,
+    where index is set if the key could be a list index. Paths are parsed
+    once and shared by all mappers that use them."""
+    if "*" in path or "\\" in path:
+        return None
+
+    segments: PathSegments = ()
+    for segment in path.split("."):
+        try:
+            index: Optional[int] = int(segment)
+        except ValueError:
+            index = None
+        # interned keys are found by identity in dicts whose keys are
+        # interned too, e.g. ones created from literals.
+        segments += ((sys.intern(segment), index),)
+    return segments
+
+
 class ExtendGlommerMixin:
     """A mixin that ensures that glom can work with huggingface Example
     and"""
@@ -59,13 +83,64 @@ class GlomMapper(ExtendGlommerMixin, SingleBaseMapper):
     print(glom.glom(dt2, spec))
     """
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(self, spec_fields: Dict[str, Union[str, tuple, glom.Spec]]):
         self.spec_fields = spec_fields
 
+        # specs are parsed once here rather than by glom on every sample;
+        # paths that are just a sequence of keys are looked up directly.
+        self._compiled_specs = tuple(
+            (key, spec, self._compile_path(spec))
+            for key, spec in spec_fields.items()
+        )
+
         super().__init__(output_fields=tuple(spec_fields.keys()))
 
+    @classmethod
+    def _compile_path(cls, spec: Any) -> Optional[PathSegments]:
+        """Turn a spec that is a dotted string path (e.g. "answers.text")
+        or a tuple of them into a sequence of (key, index) segments.
+        Returns None for specs that need glom, such as ones with stars,
+        escapes, or non-string elements."""
+        if isinstance(spec, tuple):
+            segments: PathSegments = ()
+            for sub_spec in spec:
+                compiled = cls._compile_path(sub_spec)
+                if compiled is None:
+                    return None
+                segments += compiled
+            return segments
+
+        if type(spec) is not str:
+            return None
+        return _compile_str_path(spec)
+
+    @staticmethod
+    def _lookup_path(data: Any, segments: PathSegments) -> Any:
+        for key, index in segments:
+            if type(data) is dict:
+                data = data[key]
+            elif type(data) is list and index is not None:
+                data = data[index]
+            else:
+                # anything else (e.g., objects with attributes or hf rows)
+                # is handled by glom.
+                raise LookupError(key)
+        return data
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         out = {}
-        for key, spec in self.spec_fields.items():
+        for key, spec, segments in self._compiled_specs:
+            if segments is not None:
+                try:
+                    out[key] = self._lookup_path(data, segments)
+                    continue
+                except LookupError:
+                    # glom raises its own errors for missing paths, and
+                    # might find values through attributes.
+                    pass
             out[key] = self.glommer.glom(data, spec)
         return out
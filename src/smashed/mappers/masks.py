@@ -1,4 +1,5 @@
-from typing import List
+from itertools import chain
+from typing import Any, Dict, List
 
 import numpy as np
 from typing_extensions import Annotated
@@ -9,6 +10,14 @@ from ..base import SingleBaseMapper, TransformElementType
 class IndicesToMaskMapper(SingleBaseMapper):
     """Converts a field containing a one or a list of indices to a mask."""
 
+    __slots__ = (
+        "mask_field_name",
+        "reference_field_name",
+        "locations_field_name",
+        "mask_off_value",
+        "mask_fill_value",
+    )
+
     def __init__(
         self,
         mask_field_name: str,
@@ -58,10 +67,73 @@ class IndicesToMaskMapper(SingleBaseMapper):
 
         return {self.mask_field_name: mask.tolist()}
 
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        # all masks in the column are filled as one flat array; offsets
+        # mark where the mask of each sample starts and ends.
+        lengths = [len(ref) for ref in columns[self.reference_field_name]]
+        offsets = np.cumsum([0] + lengths)
+
+        all_locs = [
+            self._locations_as_indices(locs, length)
+            for locs, length in zip(
+                columns[self.locations_field_name], lengths
+            )
+        ]
+        counts = [len(locs) for locs in all_locs]
+        flat_locs = np.fromiter(
+            chain.from_iterable(all_locs),
+            dtype=np.int64,
+            count=sum(counts),
+        )
+
+        # locations are relative to each sample; negative locations
+        # are counted from the end of the sample, like in python.
+        rows = np.repeat(np.arange(len(lengths)), counts)
+        rows_lengths = np.asarray(lengths, dtype=np.int64)[rows]
+        if np.any((flat_locs >= rows_lengths) | (flat_locs < -rows_lengths)):
+            raise IndexError(
+                f"Location in field '{self.locations_field_name}' is out "
+                f"of bounds for field '{self.reference_field_name}'"
+            )
+        flat_locs = np.where(
+            flat_locs < 0, flat_locs + rows_lengths, flat_locs
+        )
+
+        mask = np.full(offsets[-1], self.mask_off_value)
+        mask[flat_locs + offsets[rows]] = self.mask_fill_value
+
+        return {self.mask_field_name: self._split_mask(mask, offsets)}
+
+    def _locations_as_indices(self, locs: Any, length: int) -> Any:
+        """Locations can also be a boolean mask over the reference field;
+        like in `transform`, numpy semantics apply, so a mask selects the
+        locations where it is True."""
+        if isinstance(locs, int):
+            locs = [locs]
+        if len(locs) == 0 or not isinstance(locs[0], (bool, np.bool_)):
+            return locs
+        if len(locs) != length:
+            raise IndexError(
+                f"Boolean mask in field '{self.locations_field_name}' has "
+                f"length {len(locs)}, but field "
+                f"'{self.reference_field_name}' has length {length}"
+            )
+        return np.flatnonzero(locs).tolist()
+
+    @staticmethod
+    def _split_mask(mask: np.ndarray, offsets: np.ndarray) -> List[List[Any]]:
+        flat_mask = mask.tolist()
+        bounds = offsets.tolist()
+        return [flat_mask[start:end] for start, end in zip(bounds, bounds[1:])]
+
 
 class RangeToMaskMapper(IndicesToMaskMapper):
     """Converts a field containing one or more ranges of indices to a mask."""
 
+    __slots__ = ()
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         if len(data[self.locations_field_name]) == 0:
             # in case of empty ranges, return a mask of zeros
@@ -86,10 +158,67 @@ class RangeToMaskMapper(IndicesToMaskMapper):
 
         return {self.mask_field_name: mask.tolist()}
 
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        lengths = np.fromiter(
+            (len(ref) for ref in columns[self.reference_field_name]),
+            dtype=np.int64,
+            count=len(columns[self.reference_field_name]),
+        )
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+        # gather all [start, end] pairs in the column, and the sample each
+        # of them belongs to; samples with no ranges are all zeros.
+        rows: List[int] = []
+        pairs: List[Any] = []
+        is_empty = np.zeros(len(lengths), dtype=bool)
+        for i, locs in enumerate(columns[self.locations_field_name]):
+            if len(locs) == 0:
+                is_empty[i] = True
+                continue
+            # single [start, end] pair or a list of pairs
+            row_pairs = locs if isinstance(locs[0], list) else [locs]
+            rows.extend([i] * len(row_pairs))
+            pairs.extend(row_pairs)
+
+        rows_arr = np.asarray(rows, dtype=np.int64)
+        rows_lengths = lengths[rows_arr][:, None]
+        bounds = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+        # same clipping and handling of negative values as slicing the
+        # mask of each sample.
+        bounds = np.where(bounds < 0, bounds + rows_lengths, bounds)
+        bounds = np.clip(bounds, 0, rows_lengths)
+        valid = bounds[:, 1] > bounds[:, 0]
+        bounds = bounds[valid] + offsets[rows_arr[valid]][:, None]
+
+        # +1 where a range starts, -1 where it ends; after a cumulative
+        # sum, positions covered by at least one range are positive.
+        markers = np.zeros(offsets[-1] + 1, dtype=np.int64)
+        np.add.at(markers, bounds[:, 0], 1)
+        np.add.at(markers, bounds[:, 1], -1)
+        mask = np.where(
+            np.cumsum(markers[:-1]) > 0,
+            self.mask_fill_value,
+            self.mask_off_value,
+        ).astype(np.int32)
+        mask[np.repeat(is_empty, lengths)] = 0
+
+        return {self.mask_field_name: self._split_mask(mask, offsets)}
+
 
 class MaskToIndicesMapper(SingleBaseMapper):
     """Converts a field with a mask to a list of indices."""
 
+    __slots__ = (
+        "mask_field_name",
+        "locations_field_name",
+        "enforce_single_location",
+        "mask_off_value",
+        "mask_fill_value",
+    )
+
     def __init__(
         self,
         mask_field_name: str,
@@ -146,6 +275,8 @@ class MaskToIndicesMapper(SingleBaseMapper):
 class MaskToRangeMapper(MaskToIndicesMapper):
     """Converts a field with a mask to one or more of ranges of indices."""
 
+    __slots__ = ()
+
     @staticmethod
     def _find_consecutive(
         data: np.ndarray, step_size: int = 1
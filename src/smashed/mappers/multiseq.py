@@ -25,6 +25,8 @@ with necessary("transformers", soft=True) as TRANSFORMERS_AVAILABLE:
 
 
 class TokensSequencesPaddingMapper(SingleBaseMapper):
+    __slots__ = ("bos", "sep", "eos")
+
     bos: List[int]
     sep: List[int]
     eos: List[int]
@@ -104,6 +106,8 @@ class TokensSequencesPaddingMapper(SingleBaseMapper):
 
 
 class AttentionMaskSequencePaddingMapper(TokensSequencesPaddingMapper):
+    __slots__ = ()
+
     def __init__(
         self,
         tokenizer: "PreTrainedTokenizerBase",
@@ -126,6 +130,8 @@ class AttentionMaskSequencePaddingMapper(TokensSequencesPaddingMapper):
 
 
 class TokenTypeIdsSequencePaddingMapper(TokensSequencesPaddingMapper):
+    __slots__ = ()
+
     def __init__(
         self,
         tokenizer: "PreTrainedTokenizerBase",
@@ -170,6 +176,8 @@ class TokenTypeIdsSequencePaddingMapper(TokensSequencesPaddingMapper):
 
 
 class MakeAttentionMaskMapper(SingleBaseMapper):
+    __slots__ = ()
+
     def __init__(
         self,
         input_field: str = "input_ids",
@@ -450,6 +458,13 @@ class MultiSequenceStriderMapper(BatchedBaseMapper):
 
 
 class SingleValueToSequenceMapper(SingleBaseMapper):
+    __slots__ = (
+        "like_field_name",
+        "labels_field_name",
+        "strategy",
+        "padding_id",
+    )
+
     def __init__(
         self,
         single_value_field: str,
@@ -517,6 +532,8 @@ class SingleValueToSequenceMapper(SingleBaseMapper):
 
 
 class SequencesConcatenateMapper(SingleBaseMapper):
+    __slots__ = ("concat_fields",)
+
     concat_fields: Union[Dict[str, None], None]
 
     def __init__(self, concat_fields: Optional[List[str]] = None):
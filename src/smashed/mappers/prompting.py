@@ -36,6 +36,14 @@ __all__ = [
 class EncodeFieldsMapper(SingleBaseMapper):
     """Simply encodes the fields in the input data using the tokenizer."""
 
+    __slots__ = (
+        "tokenizer",
+        "is_split_into_words",
+        "offset_mapping_fields",
+        "offset_prefix",
+        "fields_to_encode",
+    )
+
     tokenizer: "PreTrainedTokenizerBase"
     is_split_into_words: bool
     fields_to_encode: Dict[str, None]
@@ -152,6 +160,14 @@ class TruncateMultipleFieldsMapper(SingleBaseMapper):
     """Truncate n encoded sequences (a.k.a. list of integers)
     to a maximum length."""
 
+    __slots__ = (
+        "tokenizer",
+        "fields_to_truncate",
+        "fields_to_preserve",
+        "max_length",
+        "strategy",
+    )
+
     def __init__(
         self,
         fields_to_truncate: List[str],
@@ -313,6 +329,8 @@ class TruncateMultipleFieldsMapper(SingleBaseMapper):
 class TruncateMultipleNestedFieldsMapper(TruncateMultipleFieldsMapper):
     """Like TruncateMultipleFieldsMapper, but works on nested fields."""
 
+    __slots__ = ()
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         # gather fields to truncate in flatted_data, keep track of
         # the indices of the fields in flatted_index
@@ -428,6 +446,8 @@ class PromptSegment:
 class FillTextPromptMapper(SingleBaseMapper):
     """Fills a prompt template with text fields."""
 
+    __slots__ = ("prompt", "output_field_name")
+
     def __init__(self, prompt_template: str, output_field_name: str):
         self.prompt = PromptSegment.from_template(template=prompt_template)
         self.output_field_name = output_field_name
@@ -1,9 +1,11 @@
 import re
-from functools import cached_property, reduce
+from functools import cached_property, lru_cache, reduce
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Literal,
@@ -25,8 +27,10 @@ from ..base.mappers import (
     TransformElementType,
 )
 
+# promptsource.templates pulls in datasets and pandas on import, so it is
+# only imported when templates are first loaded; see _get_dataset_templates.
 with necessary("promptsource", soft=True) as PROMPTSOURCE_AVAILABLE:
-    if PROMPTSOURCE_AVAILABLE or TYPE_CHECKING:
+    if TYPE_CHECKING:
         from promptsource.templates import DatasetTemplates
         from promptsource.templates import Template as PromptsourceTemplate
 
@@ -59,13 +63,54 @@ class JinjaEnvironment:
     def from_string(
         cls, template: str, env_kwargs: Optional[dict] = None
     ) -> "Template":
-        return cls.env(**(env_kwargs or {})).from_string(template)
+        if env_kwargs:
+            return cls.env(**env_kwargs).from_string(template)
+        return cls._compile(template)
 
     @classmethod
     def find_undeclared_variables(cls, template: str) -> Set[str]:
         """Find undeclared variables in a jinja template."""
-        ast = cls.env().parse(template)
-        return meta.find_undeclared_variables(ast)
+        return set(cls._parse_undeclared_variables(template))
+
+    # Many mappers are created from the same few templates (e.g., in
+    # recipes); parsing and compiling them once per unique source string
+    # is enough. Templates are bound to the singleton environment.
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile(template: str) -> "Template":
+        return JinjaEnvironment.env().from_string(template)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_undeclared_variables(template: str) -> FrozenSet[str]:
+        ast = JinjaEnvironment.env().parse(template)
+        return frozenset(meta.find_undeclared_variables(ast))
+
+
+@lru_cache(maxsize=None)
+def _get_dataset_templates(
+    dataset_name: str, subset_name: Optional[str] = None
+) -> "DatasetTemplates":
+    """Load the promptsource templates for a dataset; loading requires
+    reading and parsing a yaml file, so we only do it once per dataset."""
+    from promptsource.templates import DatasetTemplates
+
+    # the cast is because the promptsource library is not very well typed:
+    # subset_name is annotated as str, but it is optional.
+    return DatasetTemplates(
+        dataset_name=dataset_name, subset_name=cast(str, subset_name)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_promptsource_template(
+    dataset_name: str, template_name: str, subset_name: Optional[str] = None
+) -> "PromptsourceTemplate":
+    """Look up a template by name; templates are never modified after
+    loading, so they can be shared between mappers."""
+    return _get_dataset_templates(
+        dataset_name=dataset_name, subset_name=subset_name
+    )[template_name]
 
 
 class PromptsourceMixin(ChainableMapperMixIn):
@@ -185,7 +230,7 @@ class PromptsourceMixin(ChainableMapperMixIn):
     def _apply_template(self, data: Dict[str, Any]) -> Sequence[str]:
         """Split a string on the pipe escape sequence."""
         content = self._rendered_template.render(data)
-        return tuple(t.strip() for t in content.split(PIPE_ESCAPE))
+        return tuple(map(str.strip, content.split(PIPE_ESCAPE)))
 
     def apply_template(self, data: Dict[str, Any]) -> Sequence[str]:
         """Given a dictionary of data, apply the template to generate
@@ -295,12 +340,11 @@ class PromptsourceMapper(SingleTransformPromptsourceMixin):
 
     @cached_property
     def _rendered_template(self) -> "PromptsourceTemplate":
-        # the type: ignore is because the promptsource library is not
-        # very well typed, so, even though subset_name should
-        return DatasetTemplates(
+        return _get_promptsource_template(
             dataset_name=self.dataset_name,
-            subset_name=cast(str, self.subset_name),
-        )[self.template_name]
+            template_name=self.template_name,
+            subset_name=self.subset_name,
+        )
 
     def _apply_template(self, data: Dict[str, Any]) -> Sequence[str]:
         return self._rendered_template.apply(
@@ -446,18 +490,31 @@ class FewShotJinjaMapper(PromptsourceMixin, BatchedBaseMapper):
             for fields in super().approx_input_fields
         )
 
+    def _apply_template_with_shots(
+        self,
+        sample: TransformElementType,
+        shots: List[TransformElementType],
+    ) -> Dict[str, Union[str, List[str]]]:
+        output = self.apply_template({**sample, VARSHOTS: shots})
+        return self.format_output(output)
+
     def transform(
         self, data: Iterable[TransformElementType]
     ) -> Iterable[TransformElementType]:
-        accumulator: List[TransformElementType] = []
-
-        for sample in data:
-            if self.num_shots == "max" or len(accumulator) < self.num_shots:
-                accumulator.append(sample)
-            else:
-                output = self.apply_template({**sample, VARSHOTS: accumulator})
-                accumulator = []
-                yield self.format_output(output)
+        data_it = iter(data)
+
+        if self.num_shots == "max":
+            accumulator = list(data_it)
+        else:
+            # each window is made of num_shots samples used as shots,
+            # followed by the sample to render the template for.
+            window_size = self.num_shots + 1
+            while True:
+                accumulator = list(islice(data_it, window_size))
+                if len(accumulator) < window_size:
+                    break
+                *shots, sample = accumulator
+                yield self._apply_template_with_shots(sample, shots)
 
         if self.keep_last and len(accumulator) > 0:
             # we yield the last bit of the dataset; might have
@@ -465,6 +522,4 @@ class FewShotJinjaMapper(PromptsourceMixin, BatchedBaseMapper):
 
             # use the last as the non-context sample
             *accumulator, sample = accumulator
-
-            output = self.apply_template({**sample, VARSHOTS: accumulator})
-            yield self.format_output(output)
+            yield self._apply_template_with_shots(sample, accumulator)
@@ -1,5 +1,5 @@
 from functools import cached_property
-from itertools import chain
+from itertools import chain, islice, repeat
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from ..base import BatchedBaseMapper, SingleBaseMapper, TransformElementType
@@ -8,6 +8,12 @@ from ..base import BatchedBaseMapper, SingleBaseMapper, TransformElementType
 class FlattenMapper(SingleBaseMapper):
     """Flattens a list of lists into a single list."""
 
+    __slots__ = ("fields_to_flatten",)
+
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(self, field: Union[str, Sequence[str]]) -> None:
         """
         Args:
@@ -20,17 +26,27 @@ class FlattenMapper(SingleBaseMapper):
             output_fields=self.fields_to_flatten,
         )
 
-    def transform(self, data: TransformElementType) -> TransformElementType:
-        output: Dict[str, List[Any]] = {}
+    @staticmethod
+    def _flatten(to_flatten: List[Any]) -> List[Any]:
+        # one level of nesting is removed at each iteration; we stop when
+        # elements are no longer lists or there's nothing left to flatten.
+        while len(to_flatten) > 0 and isinstance(to_flatten[0], list):
+            to_flatten = list(chain.from_iterable(to_flatten))
+        return to_flatten
 
-        for field in self.fields_to_flatten:
-            to_flatten = data[field]
-            if len(to_flatten) > 0:
-                while isinstance(to_flatten[0], list):
-                    to_flatten = list(chain.from_iterable(to_flatten))
-            output[field] = to_flatten
+    def transform(self, data: TransformElementType) -> TransformElementType:
+        return {
+            field: self._flatten(data[field])
+            for field in self.fields_to_flatten
+        }
 
-        return output
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        return {
+            field: [self._flatten(value) for value in columns[field]]
+            for field in self.fields_to_flatten
+        }
 
 
 class UnpackingMapper(BatchedBaseMapper):
@@ -138,39 +154,68 @@ class UnpackingMapper(BatchedBaseMapper):
                 # which might indicate an error in setting up the mapper
                 raise ValueError("No fields to unpack!")
 
-            unpacked_samples_it: Iterable[Dict[str, Any]] = (
-                # this re-attached all the field names to just the values
-                # of the new unpacked samples.
-                {
-                    k: v
-                    for k, v in zip(
-                        all_field_names_to_unpack, unpacked_element_values
-                    )
-                }
-                # this zip goes from list of features, each containing
-                # multiple elements in this packed sample, to a list of
-                # list of features in a element.
-                for unpacked_element_values in zip(
-                    *(packed_sample[k] for k in all_field_names_to_unpack)
-                )
-            )
+            keys = all_field_names_to_unpack
+            columns = [packed_sample[k] for k in all_field_names_to_unpack]
 
             if self.ignore_behavior == self._RPT_EXTRA:
-                # duplicate the fields that have not been unpacked
+                # the fields that have not been unpacked are repeated
                 # in all new samples
-
                 features_to_duplicate = {
                     k: v
                     for k, v in packed_sample.items()
                     if k not in all_field_names_to_unpack
                 }
-                unpacked_samples_it = (
-                    # this duplicates the unpacked samples
-                    {**unpacked_sample, **features_to_duplicate}
-                    for unpacked_sample in unpacked_samples_it
+                keys = [*keys, *features_to_duplicate]
+                columns.extend(map(repeat, features_to_duplicate.values()))
+
+            # zip goes from a list of features, each containing multiple
+            # elements in this packed sample, to one tuple of values per
+            # new sample; the field names are then re-attached to them.
+            yield from map(dict, map(zip, repeat(keys), zip(*columns)))
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        if not any(columns.values()):
+            # no samples, so nothing to unpack
+            return {}
+
+        field_names_to_unpack = [
+            k for k in columns.keys() if self._check_wether_to_unpack(k)
+        ]
+        if len(field_names_to_unpack) == 0:
+            raise ValueError("No fields to unpack!")
+
+        # like zip, each sample is unpacked into as many new samples as
+        # there are elements in the shortest of its fields to unpack.
+        lengths = [list(map(len, columns[k])) for k in field_names_to_unpack]
+        counts = list(map(min, *lengths)) if len(lengths) > 1 else lengths[0]
+
+        unpacked_columns = {}
+        for k, k_lengths in zip(field_names_to_unpack, lengths):
+            if k_lengths == counts:
+                # no values to drop, so the column is just flattened;
+                # extending a list copies list values in one go, which is
+                # faster than iterating over them with chain.
+                unpacked: List[Any] = []
+                for value in columns[k]:
+                    unpacked.extend(value)
+            else:
+                unpacked = list(
+                    chain.from_iterable(map(islice, columns[k], counts))
                 )
+            unpacked_columns[k] = unpacked
+
+        if self.ignore_behavior == self._RPT_EXTRA:
+            # the fields that have not been unpacked are repeated
+            # in all new samples
+            for k, column in columns.items():
+                if k not in unpacked_columns:
+                    unpacked_columns[k] = list(
+                        chain.from_iterable(map(repeat, column, counts))
+                    )
 
-            yield from unpacked_samples_it
+        return unpacked_columns
 
 
 class SingleSequenceStriderMapper(BatchedBaseMapper):
@@ -225,15 +270,18 @@ class SingleSequenceStriderMapper(BatchedBaseMapper):
             yield sample
 
         tail_elements = 0 if self.keep_last else self.max_length
+
+        # fields that are not strided are the same in all new samples,
+        # so we only look up which fields to stride once per sample.
+        to_stride = [
+            (name, values)
+            for name, values in sample.items()
+            if name in self.fields_to_stride
+        ]
         for i in range(0, seq_len - tail_elements + 1, self.stride):
-            new_sample = {
-                name: (
-                    values[i : i + self.max_length]
-                    if name in self.fields_to_stride
-                    else values
-                )
-                for name, values in sample.items()
-            }
+            new_sample = dict(sample)
+            for name, values in to_stride:
+                new_sample[name] = values[i : i + self.max_length]
             yield new_sample
 
     def transform(
@@ -1,4 +1,6 @@
 import inspect
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Sequence, Union, cast
 
 from ftfy import TextFixerConfig, fix_text
@@ -18,6 +20,10 @@ class FtfyMapper(SingleBaseMapper):
 
     fields_to_fix: Dict[str, None]
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(
         self,
         input_fields: Union[str, List[str]],
@@ -51,37 +57,78 @@ class FtfyMapper(SingleBaseMapper):
                 )
         self.ftfy_config = TextFixerConfig(**ftfy_kwargs)
 
+        # ASCII characters that ftfy leaves alone with this config; texts
+        # that only contain these are returned without calling ftfy. Some
+        # characters are only fixed in combination with others (html
+        # entities, terminal escapes, windows line breaks), so they are
+        # never considered safe.
+        safe_chars = "".join(
+            char
+            for char in map(chr, range(128))
+            if char not in "&\x1b\r"
+            and fix_text(f"a{char}b", config=self.ftfy_config) == f"a{char}b"
+        )
+        self._needs_fixing = re.compile(f"[^{re.escape(safe_chars)}]")
+
+        # with most configs, this covers all printable ascii but '&'; if so,
+        # str builtins can tell that a text needs no fixing without a regex.
+        self._printable_ascii_is_safe = all(
+            char in safe_chars
+            for char in map(chr, range(0x20, 0x7F))
+            if char != "&"
+        )
+
         super().__init__(input_fields=input_fields, output_fields=input_fields)
 
+    def _fix(self, value: Any) -> Any:
+        if isinstance(value, str):
+            if (
+                self._printable_ascii_is_safe
+                and value.isascii()
+                and value.isprintable()
+                and "&" not in value
+            ):
+                return value
+            if self._needs_fixing.search(value) is None:
+                return value
+        return fix_text(value, config=self.ftfy_config)
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         return {
-            field: (
-                fix_text(value, config=self.ftfy_config)
-                if field in self.fields_to_fix
-                else value
-            )
+            field: self._fix(value) if field in self.fields_to_fix else value
             for field, value in data.items()
         }
 
 
+@lru_cache(maxsize=None)
+def _get_splitter(name: str) -> BaseWordSplitter:
+    """Splitters hold no per-mapper state, so mappers that use the same
+    splitter share a single instance of it."""
+    if name == "blingfire":
+        return BlingFireSplitter()
+    elif name == "plus":
+        return WhitespacePlusSplitter()
+    elif name == "trail":
+        return WhitespaceTrailSplitter()
+    elif name == "ws":
+        return WhitespaceSplitter()
+    else:
+        raise ValueError(f"Unknown splitter: {name}")
+
+
 class TextToWordsMapper(SingleBaseMapper):
     splitter: BaseWordSplitter
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(
         self,
         fields: Union[str, Sequence[str]],
         splitter: Literal["blingfire", "ws", "plus", "trail"] = "plus",
     ):
-        if splitter == "blingfire":
-            self.splitter = BlingFireSplitter()
-        elif splitter == "plus":
-            self.splitter = WhitespacePlusSplitter()
-        elif splitter == "trail":
-            self.splitter = WhitespaceTrailSplitter()
-        elif splitter == "ws":
-            self.splitter = WhitespaceSplitter()
-        else:
-            raise ValueError(f"Unknown splitter: {splitter}")
+        self.splitter = _get_splitter(splitter)
 
         fields = [fields] if isinstance(fields, str) else fields
 
@@ -92,8 +139,26 @@ class TextToWordsMapper(SingleBaseMapper):
             field: self.splitter(data[field]) for field in self.input_fields
         }
 
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        return {
+            field: self._split_column(columns[field])
+            for field in self.input_fields
+        }
+
+    def _split_column(self, column: List[Any]) -> List[Any]:
+        if all(isinstance(text, str) for text in column):
+            # all texts in the column are split in one batch
+            return self.splitter.tokenize_batch(column)
+        return [self.splitter(text) for text in column]
+
 
 class WordsToTextMapper(SingleBaseMapper):
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(
         self,
         fields: Union[str, Sequence[str]],
@@ -112,3 +177,18 @@ class WordsToTextMapper(SingleBaseMapper):
 
     def transform(self, data: TransformElementType) -> TransformElementType:
         return {field: self._join(data[field]) for field in self.input_fields}
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        return {
+            field: self._join_column(columns[field])
+            for field in self.input_fields
+        }
+
+    def _join_column(self, column: List[Any]) -> List[Any]:
+        if all(words and isinstance(words[0], str) for words in column):
+            # every sample is a single list of words, so the bound join
+            # method can be mapped over the whole column
+            return list(map(self.joiner.join, column))
+        return [self._join(words) for words in column]
@@ -5,11 +5,22 @@ Bunch of tokenization mappers for the smashed library.
 
 """
 import unicodedata
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    cast,
+)
 
 from necessary import necessary
 
-from ..base import SingleBaseMapper, TransformElementType
+from ..base import ColumnarDataset, SingleBaseMapper, TransformElementType
 
 with necessary("transformers", soft=True) as TRANSFORMERS_AVAILABLE:
     if TRANSFORMERS_AVAILABLE or TYPE_CHECKING:
@@ -84,6 +95,10 @@ class GetTokenizerOutputFieldsAndNamesMixIn:
 class TokenizerMapper(SingleBaseMapper, GetTokenizerOutputFieldsAndNamesMixIn):
     """Tokenize a field using a tokenizer."""
 
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(
         self,
         tokenizer: "PreTrainedTokenizerBase",
@@ -228,11 +243,156 @@ class TokenizerMapper(SingleBaseMapper, GetTokenizerOutputFieldsAndNamesMixIn):
             for field_name, field_value in batch_encoding.items()
         }
 
+    def _sequences_per_sample(
+        self, column: List[Any]
+    ) -> Optional[List[Optional[int]]]:
+        """Figure out whether all samples in a column can be tokenized in
+        one call with the same output as tokenizing each sample on its own.
+
+        Returns None if they can't; otherwise, returns a list with an
+        entry for each sample: None if the sample is a single sequence,
+        or the number of sequences in the sample if it is a batch."""
+        if len(column) == 0 or self.return_word_ids:
+            return None
+
+        kwargs = self.tokenize_kwargs
+        if (
+            # overflowing tokens are mapped to the position in the batch
+            kwargs.get("return_overflowing_tokens")
+            # padding to the longest sequence depends on the whole batch
+            or kwargs.get("padding", False)
+            not in (False, None, "do_not_pad", "max_length")
+            or kwargs.get("return_tensors") is not None
+        ):
+            return None
+
+        def is_sequence(value: Any) -> bool:
+            if kwargs.get("is_split_into_words"):
+                # a sequence is a non-empty list of words
+                return (
+                    isinstance(value, list)
+                    and len(value) > 0
+                    and all(isinstance(word, str) for word in value)
+                )
+            return isinstance(value, str)
+
+        sequences_per_sample: List[Optional[int]] = []
+        for sample in column:
+            if is_sequence(sample):
+                sequences_per_sample.append(None)
+            elif (
+                isinstance(sample, list)
+                and len(sample) > 0
+                and all(map(is_sequence, sample))
+            ):
+                sequences_per_sample.append(len(sample))
+            else:
+                return None
+        return sequences_per_sample
+
+    def _tokenize_column_in_batch(
+        self, column: List[Any], sequences_per_sample: List[Optional[int]]
+    ) -> Dict[str, List[Any]]:
+        # fast tokenizers process a batch of sequences in a single call
+        # to the rust backend, which is much faster than one call each;
+        # samples that contain multiple sequences are flattened first, and
+        # their outputs are grouped back together after tokenization.
+        flat_column: List[Any] = []
+        for sample, count in zip(column, sequences_per_sample):
+            if count is None:
+                flat_column.append(sample)
+            else:
+                flat_column.extend(sample)
+
+        batch_encoding = self.tokenizer(flat_column, **self.tokenize_kwargs)
+
+        # the start of the outputs of each sample in the flat batch; None
+        # if all samples are single sequences, which is the common case.
+        starts: Optional[List[int]] = None
+        if any(count is not None for count in sequences_per_sample):
+            starts = [0] * len(column)
+            start = 0
+            for j, count in enumerate(sequences_per_sample):
+                starts[j] = start
+                start += 1 if count is None else count
+
+        output: Dict[str, List[Any]] = {}
+        for field_name, field_value in batch_encoding.items():
+            # for a single sequence, the tokenizer returns its length
+            # as a list with one element.
+            wrap = field_name == "length"
+
+            if starts is None:
+                grouped = (
+                    [[value] for value in field_value]
+                    if wrap
+                    else list(field_value)
+                )
+            else:
+                grouped = [None] * len(column)
+                for j, (start, count) in enumerate(
+                    zip(starts, sequences_per_sample)
+                ):
+                    if count is None:
+                        value = field_value[start]
+                        grouped[j] = [value] if wrap else value
+                    else:
+                        grouped[j] = field_value[start : start + count]
+
+            output[self.fname(field_name)] = grouped
+        return output
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        to_tokenize = columns[self.to_tokenize_filed]
+        sequences_per_sample = self._sequences_per_sample(to_tokenize)
+        if sequences_per_sample is None:
+            return super().transform_columns(columns)
+        return self._tokenize_column_in_batch(
+            to_tokenize, sequences_per_sample
+        )
+
+    def transform_samples(
+        self, samples: Sequence[TransformElementType]
+    ) -> List[TransformElementType]:
+        to_tokenize = [sample[self.to_tokenize_filed] for sample in samples]
+        sequences_per_sample = self._sequences_per_sample(to_tokenize)
+        if sequences_per_sample is None:
+            return super().transform_samples(samples)
+        transformed = ColumnarDataset(
+            self._tokenize_column_in_batch(to_tokenize, sequences_per_sample),
+            n=len(samples),
+        ).to_rows()
+        return cast(List[TransformElementType], transformed)
+
+
+@lru_cache(maxsize=None)
+def _bmp_in_categories(categories: FrozenSet[str]) -> bytes:
+    """A table with one byte for each code point in the basic multilingual
+    plane, set to 1 if the code point belongs to one of the categories;
+    mappers with the same categories share the same table."""
+    return bytes(
+        unicodedata.category(chr(cp)) in categories for cp in range(0x10000)
+    )
+
 
 class ValidUnicodeMapper(SingleBaseMapper):
     """Given input_fields of type List[str], replaces invalid Unicode
     characters with something else"""
 
+    __slots__ = (
+        "unicode_categories",
+        "replace_token",
+        "_categories",
+        "_delete_ascii_in_categories",
+        "_bmp_table",
+    )
+
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(
         self,
         input_fields: List[str],
@@ -253,15 +413,41 @@ class ValidUnicodeMapper(SingleBaseMapper):
         self.unicode_categories = unicode_categories
         self.replace_token = replace_token
 
+        self._categories = frozenset(unicode_categories)
+
+        # translation table that deletes all ASCII characters in one of
+        # the categories; an ASCII token is invalid if nothing is left
+        # after translating it, so we don't need to look up categories.
+        self._delete_ascii_in_categories = {
+            i: None
+            for i in range(128)
+            if unicodedata.category(chr(i)) in self._categories
+        }
+        self._bmp_table = _bmp_in_categories(self._categories)
+
+    def _is_invalid(self, token: str) -> bool:
+        if token.isascii():
+            if not self._delete_ascii_in_categories:
+                # no ASCII character is in the categories (the common case,
+                # e.g. for "Mn" or "Cf"), so only empty tokens are invalid.
+                return not token
+            return not token.translate(self._delete_ascii_in_categories)
+
+        if max(token) < "\U00010000":
+            # all characters are in the basic multilingual plane, so their
+            # categories can be read from the precomputed table.
+            return all(
+                map(self._bmp_table.__getitem__, map(ord, token))
+            )
+
+        categories = self._categories
+        category = unicodedata.category
+        return all(category(ch) in categories for ch in token)
+
     def transform(self, data: TransformElementType) -> TransformElementType:
         def _transform(tokens: List[str]) -> List[str]:
             return [
-                self.replace_token
-                if all(
-                    unicodedata.category(ch) in self.unicode_categories
-                    for ch in token
-                )
-                else token
+                self.replace_token if self._is_invalid(token) else token
                 for token in tokens
             ]
 
@@ -284,6 +470,8 @@ class PaddingMapper(SingleBaseMapper):
     which often calls `tokenizer.pad`.
     """
 
+    __slots__ = ("pad_to_length", "pad_value", "fields_to_pad")
+
     def __init__(
         self,
         pad_to_length: int,
@@ -332,11 +520,33 @@ class PaddingMapper(SingleBaseMapper):
 
 
 class TruncateSingleFieldMapper(SingleBaseMapper):
+    __slots__ = ("fields_to_truncate", "_slices")
+
+    @classmethod
+    def supports_parallel_map(cls) -> bool:
+        return True
+
     def __init__(self, fields_to_truncate: Dict[str, int]) -> None:
         self.fields_to_truncate = fields_to_truncate
+
+        # the fields and lengths never change after construction, so we
+        # build the slice objects once rather than for every sample.
+        self._slices = tuple(
+            (k, slice(None, v)) for k, v in fields_to_truncate.items()
+        )
+
         super().__init__(
             input_fields=fields_to_truncate, output_fields=fields_to_truncate
         )
 
     def transform(self, data: TransformElementType) -> TransformElementType:
-        return {k: data[k][:v] for k, v in self.fields_to_truncate.items()}
+        return {k: data[k][s] for k, s in self._slices}
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        # itemgetter with a slice truncates each value without going
+        # through python bytecode for every sample.
+        return {
+            k: list(map(itemgetter(s), columns[k])) for k, s in self._slices
+        }
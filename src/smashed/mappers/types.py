@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Any, Dict, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, TypeVar, Union
 
+import numpy as np
 from necessary import necessary
 from trouting import trouting
 
@@ -173,11 +174,33 @@ class BinarizerMapper(CastMapper):
 
         """
         super().__init__(cast_map={field: int})
+        self.field = field
         self.threshold = threshold
 
     def _single_op(self, value: Any, **_: Any) -> Any:  # type: ignore
         return int(value > self.threshold)
 
+    def _recursive_op(self, value: Any, **kwargs: Any) -> Any:
+        # for short lists, converting to a numpy array costs more than
+        # comparing values one at a time.
+        if isinstance(value, list) and len(value) >= 32:
+            try:
+                array = np.asarray(value)
+            except ValueError:
+                # ragged nested lists can't be converted
+                array = None
+
+            if array is not None and array.dtype.kind in "biuf":
+                return (array > self.threshold).astype(int).tolist()
+
+        return super()._recursive_op(value=value, **kwargs)
+
+    def transform_columns(
+        self, columns: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        # the column is a list of values, so it can be binarized in one go
+        return {**columns, self.field: self._recursive_op(columns[self.field])}
+
 
 class LookupMapper(CastMapper):
     def __init__(self, field_name: str, lookup_table: Dict[Any, Any]):
@@ -202,6 +225,17 @@ class LookupMapper(CastMapper):
     def _single_op(self, value: Any, **_: Any) -> Any:  # type: ignore
         return self.lookup_table[value]
 
+    def _recursive_op(self, value: Any, **kwargs: Any) -> Any:
+        if isinstance(value, list):
+            try:
+                # map with the bound method of the dictionary skips the
+                # python frame of _single_op for every value.
+                return list(map(self.lookup_table.__getitem__, value))
+            except TypeError:
+                # nested lists and dicts are not hashable; recurse below.
+                pass
+        return super()._recursive_op(value=value, **kwargs)
+
 
 class OneHotMapper(CastMapper):
     """One-hot encodes a field in a dataset."""
@@ -3,8 +3,9 @@ from typing import TYPE_CHECKING, Literal, Optional, Sequence, Set, Union, cast
 
 from necessary import necessary
 
+# the tokenizer class is only needed for type annotations
 with necessary("transformers", soft=True) as TRANSFORMERS_AVAILABLE:
-    if TRANSFORMERS_AVAILABLE or TYPE_CHECKING:
+    if TYPE_CHECKING:
         from transformers.tokenization_utils_base import (
             PreTrainedTokenizerBase,
         )
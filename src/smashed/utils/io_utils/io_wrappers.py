@@ -58,8 +58,10 @@ class ReadIO(io.IOBase, Generic[T]):
 
         loc = self.ready_buffer.find(b"\n")
         if loc >= 0:
+            # consume the line in place rather than copying the rest
+            # of the buffer into a new bytearray.
             return_value = self.ready_buffer[: loc + 1]
-            self.ready_buffer = self.ready_buffer[loc + 1 :]
+            del self.ready_buffer[: loc + 1]
         else:
             return_value = self.ready_buffer
             self.ready_buffer = bytearray()
@@ -89,7 +91,7 @@ class ReadIO(io.IOBase, Generic[T]):
             self.ready_buffer = bytearray()
         else:
             return_value = self.ready_buffer[:size]
-            self.ready_buffer = self.ready_buffer[size:]
+            del self.ready_buffer[:size]
 
         if not (return_value or self.ready_buffer) and size != 0:
             # user has requested more than 0 bytes but there is nothing
@@ -1,6 +1,8 @@
 import io
+import os
 import shutil
 from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from logging import Logger, getLogger
 from os import remove as remove_local_file
 from os import stat as stat_local_file
@@ -37,6 +39,14 @@ ClientType = Union["BaseClient", None]
 LOGGER = getLogger(__file__)
 
 
+@lru_cache(maxsize=32)
+def _get_cached_s3_client(pid: int, **boto3_kwargs: Any) -> "BaseClient":
+    """Creating a boto3 client is slow (credentials and endpoints have to
+    be resolved), so clients are reused across calls. Clients are not safe
+    to share between processes, so the cache is also keyed by process id."""
+    return boto3.client("s3", **boto3_kwargs)  # pyright: ignore
+
+
 def get_client_if_needed(path: PathType, **boto3_kwargs: Any) -> ClientType:
     """Return the appropriate client given the protocol of the path."""
 
@@ -51,7 +61,13 @@ def get_client_if_needed(path: PathType, **boto3_kwargs: Any) -> ClientType:
                 "run 'pip install smashed[remote]' or 'pip install boto3'."
             ),
         ):
-            return boto3.client("s3", **boto3_kwargs)  # pyright: ignore
+            try:
+                hash(tuple(boto3_kwargs.values()))
+            except TypeError:
+                # some of the arguments are not hashable (e.g., a dict),
+                # so the client can't be cached.
+                return boto3.client("s3", **boto3_kwargs)  # pyright: ignore
+            return _get_cached_s3_client(os.getpid(), **boto3_kwargs)
 
     return None  # pyright: ignore
 
@@ -115,13 +131,19 @@ def stream_file_for_read(
 
         obj = client.get_object(Bucket=path.bucket, Key=path.key.lstrip("/"))
 
+        # the body is read one chunk at the time as the stream is consumed,
+        # so the object is never fully loaded in memory.
         stream: io.IOBase
         if "b" in mode:
             stream = ReadBytesIO(obj["Body"])
         else:
             stream = ReadTextIO(obj["Body"])
 
-        yield cast(IO, stream)
+        try:
+            yield cast(IO, stream)
+        finally:
+            # release the connection even if the body was not read in full
+            obj["Body"].close()
     elif path.is_local:
         with open_fn(file=path.as_str, mode=mode, **open_kwargs) as f:
             yield f
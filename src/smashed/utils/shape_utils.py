@@ -13,8 +13,23 @@ NestedSequenceType: TypeAlias = Union[
 NestedListType: TypeAlias = Union[List[T], List["NestedListType[T]"]]
 
 
+# checking against the Sequence ABC is slow, so we skip it for the
+# types we see most often.
+_FAST_SEQUENCE_TYPES = {
+    list: True,
+    tuple: True,
+    str: False,
+    bytes: False,
+    int: False,
+    float: False,
+    bool: False,
+}
+
+
 def is_sequence_but_not_str(obj: Any) -> bool:
     """Check if an object is a sequence but not a string."""
+    if type(obj) in _FAST_SEQUENCE_TYPES:
+        return _FAST_SEQUENCE_TYPES[type(obj)]
     return isinstance(obj, SequenceABC) and not isinstance(obj, (str, bytes))
 
 
@@ -41,17 +56,11 @@ def flatten_with_indices(
             original list was not nested, will be None.
     """
 
-    it = iter(sequence)
     flattened: list = []
     keys: list = []
     is_nested_sequence = is_already_flat = False
 
-    while True:
-        try:
-            item = next(it)
-        except StopIteration:
-            break
-
+    for item in sequence:
         if is_sequence_but_not_str(item):
             if is_already_flat:
                 raise ValueError(
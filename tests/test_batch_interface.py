@@ -10,6 +10,7 @@ except ImportError:
     # pre datasets 2.8.0
     from datasets.arrow_dataset import Batch as LazyBatch  # pyright: ignore
 
+from smashed.mappers import MakeFieldMapper
 from smashed.mappers.debug import MockMapper
 
 
@@ -41,3 +42,32 @@ class TestBatchInterface(unittest.TestCase):
 
     def test_batch_remove_columns(self):
         self.test_batch(remove_columns=True)
+
+    def test_single_mapper_matches_list_of_dicts(self):
+        # single mappers are applied to hf datasets in batches, but the
+        # output must be the same as mapping the samples one by one.
+        cases = [
+            (
+                MockMapper(1, output_fields=["a"]),
+                [{"a": i, "b": i ** 2} for i in range(25)],
+            ),
+            (
+                MakeFieldMapper("c", value=0, shape_like="b"),
+                [{"a": i, "b": [i] * (i % 3)} for i in range(25)],
+            ),
+        ]
+        for mapper, rows in cases:
+            for remove_columns in (False, True):
+                out = mapper.map(
+                    Dataset.from_list(rows),
+                    remove_columns=["a", "b"] if remove_columns else [],
+                    batch_size=10,
+                )
+                expected = mapper.map(
+                    deepcopy(rows), remove_columns=remove_columns
+                )
+                self.assertEqual(out.to_list(), expected)
+
+        # MakeFieldMapper returns the whole sample, so the original
+        # columns are kept even when removing columns.
+        self.assertEqual(out.column_names, ["a", "b", "c"])
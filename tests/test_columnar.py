@@ -0,0 +1,189 @@
+import unittest
+
+from smashed.base import ColumnarDataset
+from smashed.mappers import (
+    FlattenMapper,
+    IndicesToMaskMapper,
+    RangeToMaskMapper,
+    TruncateSingleFieldMapper,
+    UnpackingMapper,
+    WordsToTextMapper,
+)
+from smashed.mappers.debug import BatchMockMapper, MockMapper
+
+
+class TestColumnarDataset(unittest.TestCase):
+    def test_from_and_to_rows(self):
+        rows = [{"a": [1, 2], "b": 3}, {"a": [4], "b": 5}]
+        dataset = ColumnarDataset.from_rows(rows)
+
+        self.assertEqual(dataset.n, 2)
+        self.assertEqual(dataset.columns, {"a": [[1, 2], [4]], "b": [3, 5]})
+        self.assertEqual(dataset[1], {"a": [4], "b": 5})
+        self.assertEqual(dataset.to_rows(), rows)
+
+    def test_mismatched_columns(self):
+        with self.assertRaises(ValueError):
+            ColumnarDataset({"a": [1, 2], "b": [3]})
+
+    def test_fallback_to_transform(self):
+        rows = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+        mapper = MockMapper(1) >> BatchMockMapper(1)
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+
+        self.assertIsInstance(dataset, ColumnarDataset)
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+
+    def test_columnar_flatten(self):
+        rows = [
+            {"input_ids": [[1, 2], [3]], "labels": 0},
+            {"input_ids": [[], []], "labels": 1},
+        ]
+        mapper = FlattenMapper(field="input_ids")
+
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(dataset.columns["input_ids"], [[1, 2, 3], []])
+        self.assertEqual(dataset.columns["labels"], [0, 1])
+
+    def test_columnar_truncate(self):
+        rows = [
+            {"text": "Paris is the capital", "words": ["a", "b", "c"]},
+            {"text": "", "words": []},
+        ]
+        mapper = TruncateSingleFieldMapper(
+            fields_to_truncate={"text": 5, "words": 2}
+        )
+
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(dataset.columns["text"], ["Paris", ""])
+        self.assertEqual(dataset.columns["words"], [["a", "b"], []])
+
+    def test_columnar_unpacking(self):
+        rows = [
+            {"a": [0, 1, 2], "b": [0.5, 1.5, 2.5, 3.5], "c": "hello"},
+            {"a": [], "b": [], "c": "empty"},
+            {"a": [3], "b": [4.5], "c": "world"},
+        ]
+
+        mapper = UnpackingMapper(
+            fields_to_unpack=["a"], ignored_behavior="drop"
+        )
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(dataset.columns, {"a": [0, 1, 2, 3]})
+
+        # like zip, samples are unpacked up to their shortest field
+        mapper = UnpackingMapper(
+            fields_to_ignore=["c"], ignored_behavior="repeat"
+        )
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+
+        self.assertEqual(dataset.columns["a"], [0, 1, 2, 3])
+        self.assertEqual(dataset.columns["b"], [0.5, 1.5, 2.5, 4.5])
+        self.assertEqual(dataset.columns["c"], ["hello"] * 3 + ["world"])
+
+    def test_columnar_words_to_text(self):
+        rows = [{"words": ["a", "b"]}, {"words": ["c"]}]
+        mapper = WordsToTextMapper(fields="words", joiner="")
+
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(dataset.columns["words"], ["ab", "c"])
+
+        # samples with multiple sequences are joined one by one
+        rows.append({"words": [["d", "e"], ["f"]]})
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.columns["words"], ["ab", "c", ["de", "f"]])
+
+    def test_columnar_masks(self):
+        rows = [
+            {"input_ids": [101, 7, 8, 9, 102], "locs": [1, -2], "rng": []},
+            {"input_ids": [101, 7, 102], "locs": 0, "rng": [1, 5]},
+            {"input_ids": [], "locs": [], "rng": [[0, 1]]},
+            {
+                "input_ids": [101, 7, 8, 102],
+                "locs": [3],
+                "rng": [[0, 1], [2, 3]],
+            },
+        ]
+        mapper = IndicesToMaskMapper(
+            mask_field_name="locs_mask",
+            reference_field_name="input_ids",
+            locations_field_name="locs",
+        ) >> RangeToMaskMapper(
+            mask_field_name="rng_mask",
+            reference_field_name="input_ids",
+            locations_field_name="rng",
+            mask_off_value=-1,
+        )
+
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(
+            dataset.columns["locs_mask"],
+            [[0, 1, 0, 1, 0], [1, 0, 0], [], [0, 0, 0, 1]],
+        )
+        self.assertEqual(
+            dataset.columns["rng_mask"],
+            [[0, 0, 0, 0, 0], [-1, 1, 1], [], [1, -1, 1, -1]],
+        )
+
+    def test_columnar_masks_out_of_bounds(self):
+        rows = [{"input_ids": [101, 102], "locs": [2]}]
+        mapper = IndicesToMaskMapper(
+            mask_field_name="locs_mask",
+            reference_field_name="input_ids",
+            locations_field_name="locs",
+        )
+        with self.assertRaises(IndexError):
+            mapper.map(ColumnarDataset.from_rows(rows))
+
+    def test_columnar_masks_boolean_locations(self):
+        rows = [
+            {"input_ids": [101, 7, 102], "locs": [True, False, True]},
+            {"input_ids": [101, 102], "locs": [False, False]},
+        ]
+        mapper = IndicesToMaskMapper(
+            mask_field_name="locs_mask",
+            reference_field_name="input_ids",
+            locations_field_name="locs",
+        )
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(dataset.to_rows(), mapper.map(rows))
+        self.assertEqual(dataset.columns["locs_mask"], [[1, 0, 1], [0, 0]])
+
+        with self.assertRaises(IndexError):
+            mapper.map(
+                ColumnarDataset.from_rows(
+                    [{"input_ids": [101, 102], "locs": [True]}]
+                )
+            )
+
+    def test_remove_columns(self):
+        rows = [{"input_ids": [101, 7, 102], "locs": [1]}]
+        mapper = IndicesToMaskMapper(
+            mask_field_name="locs_mask",
+            reference_field_name="input_ids",
+            locations_field_name="locs",
+        )
+
+        dataset = mapper.map(
+            ColumnarDataset.from_rows(rows), remove_columns=True
+        )
+        self.assertEqual(dataset.to_rows(), [{"locs_mask": [0, 1, 0]}])
+
+        dataset = mapper.map(ColumnarDataset.from_rows(rows))
+        self.assertEqual(
+            dataset.to_rows(),
+            [
+                {
+                    "input_ids": [101, 7, 102],
+                    "locs": [1],
+                    "locs_mask": [0, 1, 0],
+                }
+            ],
+        )
@@ -6,7 +6,9 @@ from necessary import necessary
 
 from smashed.contrib.squad import ConcatenateContextMapper
 from smashed.mappers import (
+    ChangeFieldsMapper,
     EnumerateFieldMapper,
+    IndicesToMaskMapper,
     JinjaMapper,
     TokenizerMapper,
     TruncateMultipleFieldsMapper,
@@ -62,6 +64,26 @@ class TestPickling(unittest.TestCase):
         hasher.update(m.transform)
         hasher.hexdigest()
 
+    def test_pickle_slots(self):
+        """Test if mappers that use __slots__ can be pickled"""
+
+        m = IndicesToMaskMapper(
+            mask_field_name="mask",
+            reference_field_name="a",
+            locations_field_name="b",
+        ) >> ChangeFieldsMapper(keep_fields=["mask"])
+        self.assertFalse(hasattr(m, "__dict__"))
+
+        m2 = pickle.loads(pickle.dumps(m))
+        self.assertEqual(m, m2)
+        self.assertEqual(m2.mask_field_name, "mask")
+
+        dt = [{"a": [1, 2, 3], "b": [1]}]
+        self.assertEqual(m.map(dt), m2.map(dt))
+        self.assertEqual(
+            m.detach().map(dt), [{"a": [1, 2, 3], "b": [1], "mask": [0, 1, 0]}]
+        )
+
     def test_unpacking_fingerprint(self):
         """Test if fingerprinting works"""
         mp = (
@@ -6,10 +6,17 @@ Email:  lucas@allenai.org
 """
 
 import copy
+import tempfile
 import unittest
+from unittest import mock
 
 from smashed.base import make_pipeline
-from smashed.mappers.debug import MockMapper
+from smashed.mappers import (
+    EndCachingMapper,
+    EnumerateFieldMapper,
+    StartCachingMapper,
+)
+from smashed.mappers.debug import BatchMockMapper, MockMapper
 
 
 class TestPipeline(unittest.TestCase):
@@ -23,6 +30,11 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEqual(mapper1, pipeline)
         self.assertEqual(mapper1, pipeline.detach())
 
+        # pipelines are equal only if all their stages are equal
+        self.assertEqual(pipeline, MockMapper(1) >> MockMapper(2))
+        self.assertNotEqual(pipeline, MockMapper(1) >> MockMapper(3))
+        self.assertEqual(hash(pipeline), hash(MockMapper(1) >> MockMapper(2)))
+
     def test_rshift_lshift_implementations(self):
         """Test if two mappers compose correctly"""
         mapper1 = MockMapper(1)
@@ -103,3 +115,63 @@ class TestPipeline(unittest.TestCase):
         d3 = p3.map(dataset)
         self.assertEqual(d1, d2)
         self.assertEqual(d1, d3)
+
+    def test_run_pipeline_num_proc(self):
+        pipeline = MockMapper([1]) >> MockMapper([2]) >> MockMapper([3])
+
+        # large enough to actually be split across processes
+        dataset = [{"stage": [i]} for i in range(2048)]
+        self.assertEqual(
+            pipeline.map(dataset, num_proc=2), pipeline.map(dataset)
+        )
+
+        # batched mappers are not split across processes
+        pipeline = MockMapper([1]) >> BatchMockMapper([2])
+        self.assertFalse(pipeline._can_map_in_parallel())
+        self.assertEqual(
+            pipeline.map(dataset, num_proc=2), pipeline.map(dataset)
+        )
+
+        # neither are pipelines with a stateful stage, however large
+        pipeline = MockMapper([1]) >> EnumerateFieldMapper(
+            "stage", destination_field="id", same_id_for_repeated=False
+        )
+        self.assertFalse(pipeline._can_map_in_parallel())
+        out = pipeline.map(dataset, num_proc=2)
+        self.assertEqual(len({row["id"] for row in out}), len(dataset))
+
+        # small datasets are mapped in the current process
+        pipeline = MockMapper([1]) >> MockMapper([2])
+        with mock.patch.object(
+            MockMapper, "_map_list_of_dicts_parallel"
+        ) as parallel_map:
+            pipeline.map(dataset[:1024], num_proc=2)
+            parallel_map.assert_not_called()
+            pipeline.map(dataset, num_proc=2)
+            parallel_map.assert_called_once()
+
+    def test_num_proc_with_caching(self):
+        # caching mappers override map and must see the whole dataset
+        dataset = [{"a": i} for i in range(2048)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pipeline = (
+                StartCachingMapper(tmpdir)
+                >> MockMapper(1)
+                >> EndCachingMapper()
+            )
+            self.assertFalse(pipeline._can_map_in_parallel())
+
+            out1 = pipeline.map(dataset, num_proc=2)
+            out2 = pipeline.map(dataset, num_proc=2)
+
+        self.assertEqual(out1, [{"a": i + 1} for i in range(2048)])
+        self.assertEqual(out1, out2)
+
+    def test_num_proc_with_enumerate(self):
+        # enumeration keeps a counter, so it can't be split into chunks
+        dataset = [{"a": str(i)} for i in range(2048)]
+        mapper = EnumerateFieldMapper("a", destination_field="id")
+        self.assertFalse(mapper._can_map_in_parallel())
+
+        out = mapper.map(dataset, num_proc=2)
+        self.assertEqual([row["id"] for row in out], list(range(2048)))
@@ -60,35 +60,20 @@ class TestPromptsource(unittest.TestCase):
         )
         self.assertEqual(mapped_dataset[0]["target"], "Paris")
 
-    def test_dataset_prompt_source_mapper(self):
-        mapper = PromptsourceMapper(
-            dataset_name="squad",
-            template_name="given_context_answer_question_variation",
-        )
-        dataset = [
-            {
-                "question": "What is the capital of France?",
-                "context": "Paris is the capital of France.",
-                "answers": {"text": ["Paris"], "answer_start": [0]},
-            }
-        ]
+    def test_jinja_template_cache(self):
+        jinja = "Q: {{question}}\nA: |||{{answer}}"
+        mapper1 = JinjaMapper(jinja=jinja)
+        mapper2 = JinjaMapper(jinja=jinja, source_field_name="prompt")
 
-        mapped_dataset = mapper.map(dataset, remove_columns=True)
+        # identical sources are only compiled once
+        self.assertIs(mapper1._rendered_template, mapper2._rendered_template)
+        self.assertEqual(mapper1.input_fields, ("answer", "question"))
 
-        self.assertEqual(len(mapped_dataset), 1)
-        self.assertEqual(len(mapped_dataset[0]), 2)
+        sample = {"question": "Who is Ru Paul?", "answer": "A drag queen."}
         self.assertEqual(
-            mapped_dataset[0]["source"],
-            (
-                "Paris is the capital of France.\n\n"
-                "Q: What is the capital of France?\n\nA:"
-            ),
+            mapper1.map([sample])[0]["source"],
+            mapper2.map([sample])[0]["prompt"],
         )
-        self.assertEqual(mapped_dataset[0]["target"], "Paris")
-
-        mapper2 = SingleTransformPromptsourceMixin(mapper.template)
-        mapped_dataset2 = mapper2.map(dataset, remove_columns=True)
-        self.assertEqual(mapped_dataset, mapped_dataset2)
 
     def test_fewshot_jinja(self):
         mapper = FewShotJinjaMapper(jinja=FEW_SHOT_PROMPT, num_shots=2)
@@ -131,6 +116,18 @@ class TestPromptsource(unittest.TestCase):
                 FEW_SHOT_DATASET[i]["answer"],
             )
 
+    def test_few_shot_jinja_apply_template_override(self):
+        class UpperFewShotJinjaMapper(FewShotJinjaMapper):
+            def apply_template(self, data):
+                return tuple(s.upper() for s in super().apply_template(data))
+
+        mapper = UpperFewShotJinjaMapper(jinja=FEW_SHOT_PROMPT, num_shots=1)
+        mapped_dataset = mapper.map(FEW_SHOT_DATASET[:2])
+
+        self.assertEqual(
+            mapped_dataset[0]["target"], FEW_SHOT_DATASET[1]["answer"].upper()
+        )
+
     def test_few_shot_exception(self):
         with self.assertRaises(KeyError):
             FewShotJinjaMapper(
@@ -139,3 +136,52 @@ class TestPromptsource(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             FewShotJinjaMapper("{{ __shots__ }}", num_shots=-2)
+
+
+class TestPromptsourceMapper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # mappers are not modified by map, so all tests can share one
+        cls.squad_mapper = PromptsourceMapper(
+            dataset_name="squad",
+            template_name="given_context_answer_question_variation",
+        )
+
+    def test_dataset_prompt_source_mapper(self):
+        mapper = self.squad_mapper
+        dataset = [
+            {
+                "question": "What is the capital of France?",
+                "context": "Paris is the capital of France.",
+                "answers": {"text": ["Paris"], "answer_start": [0]},
+            }
+        ]
+
+        mapped_dataset = mapper.map(dataset, remove_columns=True)
+
+        self.assertEqual(len(mapped_dataset), 1)
+        self.assertEqual(len(mapped_dataset[0]), 2)
+        self.assertEqual(
+            mapped_dataset[0]["source"],
+            (
+                "Paris is the capital of France.\n\n"
+                "Q: What is the capital of France?\n\nA:"
+            ),
+        )
+        self.assertEqual(mapped_dataset[0]["target"], "Paris")
+
+        mapper2 = SingleTransformPromptsourceMixin(mapper.template)
+        mapped_dataset2 = mapper2.map(dataset, remove_columns=True)
+        self.assertEqual(mapped_dataset, mapped_dataset2)
+
+    def test_dataset_prompt_source_template_cache(self):
+        mapper1 = self.squad_mapper
+        mapper2 = PromptsourceMapper(
+            dataset_name="squad",
+            template_name="given_context_answer_question_variation",
+            source_field_name="prompt",
+        )
+
+        # templates for the same dataset and name are only loaded once
+        self.assertIs(mapper1._rendered_template, mapper2._rendered_template)
+        self.assertEqual(mapper1.template, mapper2.template)
@@ -43,8 +43,11 @@ FEW_SHOT_PROMPT = (
 
 
 class TestPromptsource(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tokenizer = AutoTokenizer.from_pretrained(
+    @classmethod
+    def setUpClass(cls) -> None:
+        # loading the tokenizer is slow; recipes don't modify it, so it
+        # can be shared by all tests.
+        cls.tokenizer = AutoTokenizer.from_pretrained(
             "t5-small", model_max_length=512
         )
 
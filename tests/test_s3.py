@@ -1,5 +1,6 @@
 import unittest
 from logging import getLogger
+from unittest import mock
 
 import boto3
 import moto
@@ -9,6 +10,7 @@ from smashed.utils.io_utils import (
     open_file_for_write,
     stream_file_for_read,
 )
+from smashed.utils.io_utils.operations import get_client_if_needed
 
 
 class TestIo(unittest.TestCase):
@@ -18,15 +20,26 @@ class TestIo(unittest.TestCase):
     CONTENT = "This is a test\nWith multiple lines\nBye!"
     REGION = "us-east-1"
 
+    @classmethod
+    def setUpClass(cls):
+        # starting moto patches botocore, so we only do it once per class
+        cls.mock_s3.start()
+        cls.conn = boto3.resource("s3", region_name=cls.REGION)
+        cls.client = boto3.client("s3", region_name=cls.REGION)
+        getLogger("botocore").setLevel("INFO")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock_s3.stop()
+
     def setUp(self):
-        self.mock_s3.start()
-        self.conn = boto3.resource("s3", region_name=self.REGION)
         self.conn.create_bucket(Bucket=self.BUCKET_NAME)
-        self.client = boto3.client("s3", region_name=self.REGION)
-        getLogger("botocore").setLevel("INFO")
 
     def tearDown(self):
-        self.mock_s3.stop()
+        # start each test from an empty bucket
+        bucket = self.conn.Bucket(self.BUCKET_NAME)
+        bucket.objects.all().delete()
+        bucket.delete()
 
     @property
     def PREFIX(self):
@@ -63,3 +76,30 @@ class TestIo(unittest.TestCase):
         with stream_file_for_read(self.PREFIX) as f:
             for la, lb in zip(f, self.CONTENT.split("\n")):
                 self.assertEqual(la.strip(), lb)
+
+    def test_stream_closes_body(self):
+        self._write_file()
+        body = self.client.get_object(
+            Bucket=self.BUCKET_NAME, Key=self.FILE_KEY
+        )["Body"]
+
+        class _Client:
+            def get_object(self, **_):
+                return {"Body": body}
+
+        with mock.patch.object(body, "close", wraps=body.close) as close:
+            with stream_file_for_read(self.PREFIX, client=_Client()) as f:
+                self.assertEqual(
+                    next(f).strip(), self.CONTENT.split("\n")[0]
+                )
+            close.assert_called_once()
+
+    def test_client_is_reused(self):
+        client = get_client_if_needed(self.PREFIX, region_name=self.REGION)
+        self.assertIs(
+            client, get_client_if_needed(self.PREFIX, region_name=self.REGION)
+        )
+        self.assertIsNot(
+            client, get_client_if_needed(self.PREFIX, region_name="us-west-2")
+        )
+        self.assertIsNone(get_client_if_needed("/tmp/test.jsonl"))
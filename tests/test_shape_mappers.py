@@ -26,6 +26,23 @@ class TestFlattenMapper(unittest.TestCase):
             {"input_ids": [9, 10, 11, 12, 13, 14, 15, 16]},
         ]
 
+    def test_map_nested_and_empty(self):
+        mapper = FlattenMapper(field="input_ids")
+        dataset = [
+            {"input_ids": [[[1, 2], [3]], [[4]]]},
+            {"input_ids": [[], []]},
+            {"input_ids": []},
+        ]
+        new_dataset = mapper.map(dataset)
+        self.assertEqual(
+            new_dataset,
+            [
+                {"input_ids": [1, 2, 3, 4]},
+                {"input_ids": []},
+                {"input_ids": []},
+            ],
+        )
+
     def test_stride(self):
         mapper = SingleSequenceStriderMapper(
             field_to_stride="input_ids", max_length=3, stride=1
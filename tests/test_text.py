@@ -34,6 +34,19 @@ class TestFtfyMapper(unittest.TestCase):
         self.assertEqual(result[4], {"text": "à perturber la réflexion"})
         self.assertEqual(result[5], {"text": "PÉREZ"})
 
+    def test_ftfy_mapper_ascii(self):
+        # clean ascii text skips ftfy, but entities and control characters
+        # still get fixed.
+        dataset = [
+            {"text": "Nothing to fix here (really): 100% [ok]!\n"},
+            {"text": "Fish &amp; chips"},
+            {"text": "Line\r\nbreak\x00"},
+        ]
+        result = FtfyMapper(input_fields="text").map(dataset)
+        self.assertEqual(result[0], dataset[0])
+        self.assertEqual(result[1], {"text": "Fish & chips"})
+        self.assertEqual(result[2], {"text": "Line\nbreak"})
+
 
 class TestToWords(unittest.TestCase):
     def test_text_truncate_mapper(self):
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from smashed.base import ColumnarDataset
 from smashed.mappers.text import TextToWordsMapper, WordsToTextMapper
+from smashed.utils.wordsplitter import BlingFireSplitter
 
 
 class TestText2Words(TestCase):
@@ -12,3 +14,30 @@ class TestText2Words(TestCase):
         dataset = [{"text": text}]
         mapped_dataset = mapper.map(dataset)
         self.assertEqual(mapped_dataset[0]["text"], text)
+
+    def test_blingfire_batch(self):
+        texts = [
+            "Hello world! What a beautiful day...",
+            "",
+            "I live in the U.S.",
+            "Dr. Smith is in.\nOR NOT?",
+        ]
+        mapper = TextToWordsMapper(fields="text", splitter="blingfire")
+        dataset = [{"text": text} for text in texts]
+
+        batched = mapper.map(ColumnarDataset.from_rows(dataset))
+        self.assertEqual(batched.to_rows(), mapper.map(dataset))
+        self.assertEqual(batched.columns["text"][1], [])
+        self.assertEqual(batched.columns["text"][2][-2:], ["U.S", "."])
+
+    def test_blingfire_batch_separator_in_text(self):
+        mapper = TextToWordsMapper(fields="text", splitter="blingfire")
+        sep = BlingFireSplitter.BATCH_SEPARATOR
+        texts = ["first text", f"a {sep} b", "last text"]
+        dataset = [{"text": text} for text in texts]
+
+        batched = mapper.map(ColumnarDataset.from_rows(dataset))
+        self.assertEqual(
+            batched.columns["text"],
+            [["first", "text"], ["a", sep, "b"], ["last", "text"]],
+        )
@@ -7,9 +7,11 @@ Tests for TokenizeMappers module
 """
 
 import unittest
+from typing import List
 
 from transformers.models.auto.tokenization_auto import AutoTokenizer
 
+from smashed.base import ColumnarDataset
 from smashed.mappers.tokenize import TokenizerMapper, ValidUnicodeMapper
 
 
@@ -67,12 +69,19 @@ class TestValidUnicodeMapper(unittest.TestCase):
 class TestTokenizerMapper(unittest.TestCase):
     """Test TokenizationMapper"""
 
-    def setUp(self):
-        """define tokenizer for all tests"""
-        self.tokenizer = AutoTokenizer.from_pretrained(
+    @classmethod
+    def setUpClass(cls):
+        """define tokenizer for all tests; loading it is slow, and mappers
+        don't modify it, so it is shared by all tests"""
+        cls.tokenizer = AutoTokenizer.from_pretrained(
             "allenai/scibert_scivocab_uncased"
         )
 
+    def _ids(self, text: str) -> List[int]:
+        """Token ids of a text, including special tokens; comparing ids
+        avoids decoding the output of the mapper back to text."""
+        return self.tokenizer(text)["input_ids"]
+
     def test_map(self):
         """Test that TokenizationMapper returns the right fields
         and is doing something right"""
@@ -114,14 +123,14 @@ class TestTokenizerMapper(unittest.TestCase):
             len(new_dataset[0]["input_ids"]),
         )
 
-        # decoding works as expected
+        # token ids are as expected
         self.assertEqual(
-            self.tokenizer.decode(new_dataset[0]["input_ids"][0]),
-            "[CLS] this is a sentence. [SEP]",
+            new_dataset[0]["input_ids"][0],
+            self._ids("this is a sentence."),
         )
         self.assertEqual(
-            self.tokenizer.decode(new_dataset[0]["input_ids"][1]),
-            "[CLS] this is two sentences. here is the second one. [SEP]",
+            new_dataset[0]["input_ids"][1],
+            self._ids("this is two sentences. here is the second one."),
         )
 
     def test_truncation_max_length(self):
@@ -146,17 +155,17 @@ class TestTokenizerMapper(unittest.TestCase):
 
         new_dataset = mapper.map(dataset)
         assert len(dataset) == len(new_dataset)  # same num dicts
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][0])
-            == "[CLS] this is an instance that will be truncated [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][0],
+            self._ids("this is an instance that will be truncated"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][1])
-            == "[CLS] this is the subsequent unit in this instance [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][1],
+            self._ids("this is the subsequent unit in this instance"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[1]["input_ids"][0])
-            == "[CLS] this is the next instance. [SEP]"
+        self.assertEqual(
+            new_dataset[1]["input_ids"][0],
+            self._ids("this is the next instance."),
         )
 
     def test_overflow(self):
@@ -187,29 +196,29 @@ class TestTokenizerMapper(unittest.TestCase):
         new_dataset = mapper.map(dataset)
         assert len(dataset) == len(new_dataset)  # same num dicts
         assert "overflow_to_sample_mapping" in new_dataset[0]
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][0])
-            == "[CLS] this is an instance that will be truncated [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][0],
+            self._ids("this is an instance that will be truncated"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][1])
-            == "[CLS] because it is longer than ten word pieces [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][1],
+            self._ids("because it is longer than ten word pieces"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][2])
-            == "[CLS]. [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][2],
+            self._ids("."),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][3])
-            == "[CLS] this is the subsequent unit in this instance [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][3],
+            self._ids("this is the subsequent unit in this instance"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][4])
-            == "[CLS] that will be separately truncated. [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][4],
+            self._ids("that will be separately truncated."),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[1]["input_ids"][0])
-            == "[CLS] this is the next instance. [SEP]"
+        self.assertEqual(
+            new_dataset[1]["input_ids"][0],
+            self._ids("this is the next instance."),
         )
 
     def test_char_offsets(self):
@@ -292,13 +301,13 @@ class TestTokenizerMapper(unittest.TestCase):
             },
         ]
         new_dataset = mapper.map(dataset)
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"])
-            == "[CLS] this is a sentence. this is two [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"],
+            self._ids("this is a sentence. this is two"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[1]["input_ids"])
-            == "[CLS] this is a separate instance. this is [SEP]"
+        self.assertEqual(
+            new_dataset[1]["input_ids"],
+            self._ids("this is a separate instance. this is"),
         )
 
         # compare with `test_overflow()`
@@ -323,25 +332,25 @@ class TestTokenizerMapper(unittest.TestCase):
             {"text": ["This is the next instance."]},
         ]
         new_dataset = mapper.map(dataset)
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][0])
-            == "[CLS] this is an instance that will be truncated [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][0],
+            self._ids("this is an instance that will be truncated"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][1])
-            == "[CLS] because it is longer than ten word pieces [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][1],
+            self._ids("because it is longer than ten word pieces"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][2])
-            == "[CLS]. this is the subsequent unit in this [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][2],
+            self._ids(". this is the subsequent unit in this"),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[0]["input_ids"][3])
-            == "[CLS] instance that will be separately truncated. [SEP]"
+        self.assertEqual(
+            new_dataset[0]["input_ids"][3],
+            self._ids("instance that will be separately truncated."),
         )
-        assert (
-            self.tokenizer.decode(new_dataset[1]["input_ids"][0])
-            == "[CLS] this is the next instance. [SEP]"
+        self.assertEqual(
+            new_dataset[1]["input_ids"][0],
+            self._ids("this is the next instance."),
         )
 
     def test_return_words(self):
@@ -500,3 +509,36 @@ class TestTokenizerMapper(unittest.TestCase):
                 },
             )
             mapper.map(dataset)
+
+    def test_columnar_batch(self):
+        dataset = [
+            {"text": "This is a sentence."},
+            {"text": "This is another, longer sentence."},
+            {"text": ""},
+        ]
+        for kwargs in (
+            {"return_length": True, "return_offsets_mapping": True},
+            {"max_length": 4, "truncation": True},
+            {"padding": "longest"},
+        ):
+            mapper = TokenizerMapper(
+                input_field="text", tokenizer=self.tokenizer, **kwargs
+            )
+            self.assertEqual(
+                mapper.map(ColumnarDataset.from_rows(dataset)).to_rows(),
+                mapper.map(dataset),
+            )
+
+    def test_batch_multiple_sequences(self):
+        dataset = [
+            {"text": ["This is a sentence.", "And another one."]},
+            {"text": "A single sentence."},
+            {"text": ["Just one in a list."]},
+        ]
+        mapper = TokenizerMapper(
+            input_field="text", tokenizer=self.tokenizer, return_length=True
+        )
+        self.assertEqual(
+            mapper.map(dataset),
+            [{**sample, **mapper.transform(sample)} for sample in dataset],
+        )
@@ -6,6 +6,7 @@ from necessary import necessary
 with necessary("datasets"):
     from datasets.arrow_dataset import Dataset
 
+from smashed.base import ColumnarDataset
 from smashed.mappers.types import BinarizerMapper, LookupMapper
 
 
@@ -28,6 +29,21 @@ class TestBinarizer(TestCase):
         dataset = Dataset.from_dict({"a": [[0.3, 0.4, 0.8]], "b": [0.9]})
         self._run_tests(dataset)
 
+    def test_binarizer_long_lists(self):
+        values = [i / 100 for i in range(100)]
+        dataset = [{"a": values, "b": [values, values]}]
+        expected = [int(v > 0.7) for v in values]
+
+        mapper = BinarizerMapper(field="a", threshold=0.7) >> BinarizerMapper(
+            field="b", threshold=0.7
+        )
+        mapped_dataset = mapper.map(dataset)
+        self.assertEqual(mapped_dataset[0]["a"], expected)
+        self.assertEqual(mapped_dataset[0]["b"], [expected, expected])
+
+        columnar = mapper.map(ColumnarDataset.from_rows(dataset))
+        self.assertEqual(columnar.to_rows(), mapped_dataset)
+
     def test_lookup_mapper(self):
         dataset = [
             {"menu": ["apple", "pie"]},
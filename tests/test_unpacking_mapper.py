@@ -9,9 +9,7 @@ class TestUnpackingMapper(unittest.TestCase):
         dataset = [{"a": [0, 1, 2, 3]}, {"a": [4, 5]}]
         dataset = mapper.map(dataset)
 
-        self.assertEqual(len(dataset), 6)
-        for i in range(6):
-            self.assertEqual(dataset[i], {"a": i})
+        self.assertEqual(dataset, [{"a": i} for i in range(6)])
 
     def test_unpack_multiple(self):
         mapper = UnpackingMapper()
@@ -21,11 +19,16 @@ class TestUnpackingMapper(unittest.TestCase):
         ]
         dataset = mapper.map(dataset)
 
-        self.assertEqual(len(dataset), 6)
-        for i in range(6):
-            self.assertEqual(
-                dataset[i], {"a": float(f"{i}.1"), "b": float(f"{i}.2")}
-            )
+        self.assertEqual(
+            dataset,
+            [
+                {"a": a, "b": b}
+                for a, b in zip(
+                    [0.1, 1.1, 2.1, 3.1, 4.1, 5.1],
+                    [0.2, 1.2, 2.2, 3.2, 4.2, 5.2],
+                )
+            ],
+        )
 
     def test_unpack_multiple_while_skipping_fields(self):
         mapper = UnpackingMapper(
@@ -37,15 +40,12 @@ class TestUnpackingMapper(unittest.TestCase):
         ]
 
         dropped_dataset = mapper.map(dataset)
-        self.assertEqual(len(dropped_dataset), 6)
-        for i in range(6):
-            self.assertEqual(dropped_dataset[i], {"a": i})
-            self.assertFalse("b" in dropped_dataset[i])
+        self.assertEqual(dropped_dataset, [{"a": i} for i in range(6)])
 
         mapper = UnpackingMapper(
             fields_to_unpack=["a"], ignored_behavior="repeat"
         )
         repeated_dataset = mapper.map(dataset)
-        self.assertEqual(len(repeated_dataset), 6)
-        for i in range(6):
-            self.assertEqual(repeated_dataset[i], {"a": i, "b": "hello"})
+        self.assertEqual(
+            repeated_dataset, [{"a": i, "b": "hello"} for i in range(6)]
+        )